@@ -1,46 +1,120 @@
 import os
 import threading
+import queue
 import time
-from flask import Flask, render_template, request, jsonify, send_file, Response
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 import logging
-from logging.handlers import RotatingFileHandler
-from io import StringIO
 import csv
-import json
+import gzip
+from collections import deque
+from itertools import islice
 from datetime import datetime
-from main import EnhancedBusinessScraper
+from main import CSV_ENCODERS, CSV_HEADERS, EnhancedBusinessScraper, as_shallow_dict, dumps_json
+
+# JSON responses smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 2048
+
+
+class Echo:
+    """File-like sink that hands back whatever is written to it"""
+    def write(self, value):
+        return value
 
 # Create Flask app
 app = Flask(__name__)
 
-# Configure logging to capture all output
-log_capture_string = StringIO()
-string_handler = logging.StreamHandler(log_capture_string)
-string_handler.setLevel(logging.INFO)
+class LogBufferHandler(logging.Handler):
+    """Keep the most recent formatted log lines in a bounded buffer"""
+    
+    def __init__(self, maxlen=200):
+        super().__init__()
+        self.buffer = deque(maxlen=maxlen)
+        self.seq = 0  # total lines ever emitted, used as a cursor by clients
+        self.changed = threading.Condition()
+    
+    def emit(self, record):
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self.changed:
+            self.buffer.append(line)
+            self.seq += 1
+            self.changed.notify_all()
+    
+    def lines_since(self, seq):
+        """Return (current_seq, lines emitted after seq that are still buffered)"""
+        with self.changed:
+            count = min(self.seq - seq, len(self.buffer))
+            if count <= 0:
+                return self.seq, []
+            return self.seq, list(islice(self.buffer, len(self.buffer) - count, None))
+
+# Configure logging to capture recent output
+log_handler = LogBufferHandler(maxlen=200)
+log_handler.setLevel(logging.INFO)
 
 formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-string_handler.setFormatter(formatter)
+log_handler.setFormatter(formatter)
 
 # Get the root logger
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)
-root_logger.addHandler(string_handler)
+root_logger.addHandler(log_handler)
+
+
+def notify_state_change():
+    """Wake up any /events streams waiting for new state"""
+    with log_handler.changed:
+        log_handler.changed.notify_all()
+
+# Blocking Playwright scrapes run on a single long-lived worker so request
+# threads only ever touch cheap in-memory state. The worker is a daemon
+# thread, unlike concurrent.futures workers, so Ctrl-C or interpreter exit
+# doesn't wait for a running scrape to finish.
+scrape_jobs = queue.Queue()
+
+def scrape_worker():
+    """Run queued scrape jobs one at a time"""
+    while True:
+        fn, args = scrape_jobs.get()
+        try:
+            fn(*args)
+        except Exception:
+            # Jobs report their own errors through `state`, just keep the
+            # worker alive
+            logging.exception("Scrape job failed")
 
-# Also log to file
-# file_handler = RotatingFileHandler('flask_scraper.log', maxBytes=1000000, backupCount=5)
-# file_handler.setFormatter(formatter)
-# root_logger.addHandler(file_handler)
+threading.Thread(target=scrape_worker, name="scraper", daemon=True).start()
 
-# Global variables to manage scraping state
-scraping_thread = None
-scraping_results = []
-is_scraping = False
-current_query = ""
-scraping_error = None
+@dataclass
+class ScrapeState:
+    """Scraping state shared between the worker and request threads"""
+    is_scraping: bool = False
+    query: str = ""
+    results: List = field(default_factory=list)
+    results_dicts: List[Dict] = field(default_factory=list)  # dict form of results, built once per scrape
+    error: Optional[str] = None
+    version: int = 0  # bumped on every change, used for status ETags
+
+# All reads and writes of `state` go through `state_lock`. Result lists are
+# only ever replaced, never mutated, so a reference taken under the lock
+# stays consistent after it is released.
+state = ScrapeState()
+state_lock = threading.Lock()
+
+# Playwright driver and browser reused across scrapes. Playwright objects are
+# bound to the thread that created them, so these are only ever touched from
+# the scrape worker thread.
+worker_playwright = None
+worker_browser = None
 
 # Modified version of the main function to work with Flask
 def run_scraper_in_thread(query, location, max_results, output_format):
-    global is_scraping, scraping_results, scraping_error
+    global worker_playwright, worker_browser
     
     try:
         # Create a modified args object
@@ -58,32 +132,50 @@ def run_scraper_in_thread(query, location, max_results, output_format):
                 self.save_db = False
                 self.reference_lat = None
                 self.reference_lng = None
+                self.session_log = None
         
         args = Args(query, location, max_results, output_format)
         
         # Initialize and run scraper
-        scraper = EnhancedBusinessScraper(args)
+        scraper = EnhancedBusinessScraper(
+            args, playwright_driver=worker_playwright, browser=worker_browser, keep_browser=True
+        )
         
         logging.info(f"Starting scraping for: {query}")
         if location:
             logging.info(f"Location: {location}")
         
-        results = scraper.scrape_google_maps()
-        
-        # Retry failed websites if any
-        if hasattr(scraper.website_crawler, 'failed_websites') and scraper.website_crawler.failed_websites:
-            results = scraper.retry_failed_websites(results)
+        try:
+            results = scraper.scrape_google_maps()
+            
+            # Retry failed websites if any
+            if hasattr(scraper.website_crawler, 'failed_websites') and scraper.website_crawler.failed_websites:
+                results = scraper.retry_failed_websites(results)
+        finally:
+            # Hold on to the browser for the next scrape
+            worker_playwright, worker_browser = scraper.playwright_driver, scraper.browser
+            scraper.website_crawler.close()
         
-        # Store results
-        scraping_results = results
+        # Store results along with their dict form so polls and downloads
+        # don't rebuild it on every request
+        results_dicts = [as_shallow_dict(result) for result in results]
+        with state_lock:
+            state.results = results
+            state.results_dicts = results_dicts
+            state.version += 1
         
         logging.info(f"Scraping completed successfully. Found {len(results)} results.")
         
     except Exception as e:
         logging.error(f"Error in scraping thread: {str(e)}")
-        scraping_error = str(e)
+        with state_lock:
+            state.error = str(e)
+            state.version += 1
     finally:
-        is_scraping = False
+        with state_lock:
+            state.is_scraping = False
+            state.version += 1
+        notify_state_change()
 
 @app.route('/')
 def index():
@@ -91,11 +183,6 @@ def index():
 
 @app.route('/start_scraping', methods=['POST'])
 def start_scraping():
-    global scraping_thread, is_scraping, current_query, scraping_error
-    
-    if is_scraping:
-        return jsonify({'status': 'error', 'message': 'Scraping is already in progress'})
-    
     query = request.form.get('query')
     location = request.form.get('location', '')
     max_results = request.form.get('max_results', '20')
@@ -111,57 +198,154 @@ def start_scraping():
     except ValueError:
         return jsonify({'status': 'error', 'message': 'Max results must be a valid number'})
     
-    # Reset error state
-    scraping_error = None
-    
-    current_query = query
-    is_scraping = True
-    scraping_results = []
-    
-    # Start scraping in a separate thread
-    scraping_thread = threading.Thread(
-        target=run_scraper_in_thread,
-        args=(query, location, max_results, output_format)
-    )
-    scraping_thread.daemon = True
-    scraping_thread.start()
+    with state_lock:
+        if state.is_scraping:
+            return jsonify({'status': 'error', 'message': 'Scraping is already in progress'})
+        
+        # Reset state for the new scrape
+        state.is_scraping = True
+        state.query = query
+        state.results = []
+        state.results_dicts = []
+        state.error = None
+        state.version += 1
+        
+        # Hand the scrape off to the worker thread
+        scrape_jobs.put((run_scraper_in_thread, (query, location, max_results, output_format)))
     
     return jsonify({'status': 'success', 'message': 'Scraping started'})
 
 @app.route('/scraping_status')
 def scraping_status():
-    global is_scraping, scraping_results, scraping_error
+    # Clients pass back the last log seq they saw and only get newer lines,
+    # otherwise return the last 50 lines of logs
+    since = request.args.get('since', type=int)
+    # The body depends on the cursor as well as on the state, so it is part
+    # of the ETag. The tag is weak because the same content may be sent
+    # gzip-encoded or not
+    cursor = 'tail' if since is None else since
+    if since is None:
+        since = max(log_handler.seq - 50, 0)
     
-    # Get the log contents
-    log_contents = log_capture_string.getvalue()
-    log_lines = log_contents.split('\n') if log_contents else []
+    # Nothing changed since the client's last poll
+    with state_lock:
+        etag = f"{state.version}-{log_handler.seq}-{cursor}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        response.vary.add('Accept-Encoding')
+        return response
     
-    # Return the last 50 lines of logs
-    recent_logs = log_lines[-50:] if len(log_lines) > 50 else log_lines
+    log_seq, recent_logs = log_handler.lines_since(since)
     
+    with state_lock:
+        is_scraping = state.is_scraping
+        results_dicts = state.results_dicts
+        error = state.error
+        version = state.version
+    
+    # Results themselves are fetched once from /results when scraping ends
     status_data = {
         'is_scraping': is_scraping,
         'logs': recent_logs,
-        'result_count': len(scraping_results)
+        'log_seq': log_seq,
+        'result_count': len(results_dicts)
     }
     
-    # Add results if available
-    if scraping_results:
-        from main import asdict
-        status_data['results'] = [asdict(result) for result in scraping_results]
-    
     # Add error information if there was an error
-    if scraping_error and not is_scraping:
-        status_data['error'] = scraping_error
+    if error and not is_scraping:
+        status_data['error'] = error
+    
+    response = Response(dumps_json(status_data), mimetype='application/json')
+    response.set_etag(f"{version}-{log_seq}-{cursor}", weak=True)
+    return response
+
+@app.route('/events')
+def events():
+    """Push status deltas to the client as Server-Sent Events"""
+    
+    def generate():
+        # Start from the same 50-line window /scraping_status returns
+        cursor = max(log_handler.seq - 50, 0)
+        was_scraping = None
+        
+        while True:
+            with log_handler.changed:
+                # Reading the flag without state_lock is fine here, the
+                # snapshot below is taken under the lock
+                changed = log_handler.changed.wait_for(
+                    lambda: log_handler.seq != cursor or state.is_scraping != was_scraping,
+                    timeout=15
+                )
+            if not changed:
+                # Keep idle connections alive through proxies
+                yield ": keepalive\n\n"
+                continue
+            
+            cursor, logs = log_handler.lines_since(cursor)
+            with state_lock:
+                was_scraping = state.is_scraping
+                results_dicts = state.results_dicts
+                error = state.error
+            
+            delta = {
+                'is_scraping': was_scraping,
+                'logs': logs,
+                'result_count': len(results_dicts)
+            }
+            
+            if not was_scraping and error:
+                delta['error'] = error
+            
+            yield f"data: {dumps_json(delta)}\n\n"
+            
+            # The scrape is over, let the client close the stream
+            if not was_scraping:
+                return
     
-    return jsonify(status_data)
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+
+@app.route('/results')
+def get_results():
+    with state_lock:
+        results_dicts = state.results_dicts
+    
+    return jsonify({'results': results_dicts})
+
+
+@app.after_request
+def compress_response(response):
+    """Gzip larger JSON responses for clients that accept it"""
+    if (response.mimetype != 'application/json'
+            or response.is_streamed
+            or response.status_code != 200
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    # Whether this body gets compressed depends on the request's
+    # Accept-Encoding, so caches must key on it either way
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.headers.get('Accept-Encoding', '').lower():
+        return response
+    
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
 
 
 @app.route('/download_results')
 def download_results():
-    global scraping_results
+    with state_lock:
+        results = state.results
+        results_dicts = state.results_dicts
     
-    if not scraping_results:
+    if not results:
         return jsonify({'status': 'error', 'message': 'No results to download'})
     
     format_type = request.args.get('format', 'csv')
@@ -170,43 +354,32 @@ def download_results():
     if format_type == 'csv':
         filename = f"businesses_{timestamp}.csv"
         
-        # Create CSV in memory
-        output = StringIO()
-        
-        if scraping_results:
-            from main import asdict
-            # Get headers from the first result
-            headers = list(asdict(scraping_results[0]).keys())
-            writer = csv.DictWriter(output, fieldnames=headers)
+        def generate():
+            # Rows are written into an echo buffer and yielded one at a time
+            writer = csv.writer(Echo())
+            yield writer.writerow(CSV_HEADERS)
             
-            # Write header
-            writer.writeheader()
-            
-            # Write data
-            for result in scraping_results:
-                row = asdict(result)
-                row['emails'] = ', '.join(row['emails'])
-                row['social_media'] = json.dumps(row['social_media'])
-                row['coordinates'] = json.dumps(row['coordinates']) if row['coordinates'] else ''
-                writer.writerow(row)
-        
-        output.seek(0)
+            for result in results:
+                yield writer.writerow([encode(getattr(result, name)) for name, encode in CSV_ENCODERS])
         
         return Response(
-            output.getvalue(),
+            stream_with_context(generate()),
             mimetype="text/csv",
             headers={"Content-disposition": f"attachment; filename={filename}"}
         )
     
     elif format_type == 'json':
         filename = f"businesses_{timestamp}.json"
+        rows = results_dicts
         
-        from main import asdict
-        data = [asdict(result) for result in scraping_results]
-        json_str = json.dumps(data, indent=2, ensure_ascii=False)
+        def generate():
+            yield '['
+            for i, row in enumerate(rows):
+                yield (',\n' if i else '\n') + dumps_json(row)
+            yield '\n]'
         
         return Response(
-            json_str,
+            stream_with_context(generate()),
             mimetype="application/json",
             headers={"Content-disposition": f"attachment; filename={filename}"}
         )
@@ -222,4 +395,7 @@ if __name__ == '__main__':
     if not os.path.exists('templates'):
         os.makedirs('templates')
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server only. In production run a single worker, since the
+    # scrape state and browser live in this process:
+    #   gunicorn -w 1 -k gthread --threads 8 app:app
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
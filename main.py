@@ -5,18 +5,25 @@ import json
 import sqlite3
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import random
-import pickle
-from urllib.parse import urljoin, urlparse
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
+import heapq
+from operator import attrgetter
+from urllib.parse import urldefrag, urljoin, urlparse
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import List, Dict, Optional, Set
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from itertools import islice
 import psutil
 import validators
 import urllib.parse
+from math import radians, sin, cos, sqrt, atan2, fsum
 
 # Third-party imports
 import playwright
@@ -27,8 +34,37 @@ from rich.table import Table
 from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
 from rich.live import Live
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from openpyxl.styles import Font, PatternFill
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # fall back to regex link extraction
+    HTMLParser = None
+
+try:
+    import re2
+except ImportError:  # fall back to the backtracking stdlib engine
+    re2 = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+
+def dumps_json(obj, indent=False):
+    """Serialize obj to a JSON string, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    # Compact separators match orjson's output, so exported cells read the
+    # same with or without it
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
 # Initialize rich console
 console = Console()
 
@@ -42,7 +78,123 @@ logging.basicConfig(
     ]
 )
 
-@dataclass
+# Patterns used on every crawled page, compiled once
+# Word boundaries and a capped TLD keep the scan from backtracking over long
+# runs of junk in minified HTML. RE2, when installed, guarantees a linear-time
+# scan of every fetched page
+if re2 is not None:
+    EMAIL_RE = re2.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,24}\b")
+else:
+    # The atomic group stops a local part that isn't followed by '@' from
+    # being retried at every shorter length (Python 3.11+)
+    EMAIL_RE = re.compile(r"\b(?>[A-Za-z0-9._%+-]+)@[A-Za-z0-9.-]+\.[A-Za-z]{2,24}\b")
+URL_TOKEN_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+# Contact details are virtually always in the first part of a page's HTML
+MAX_PAGE_BYTES = 512 * 1024
+
+# Export files are written through a larger buffer than the 8 KiB default
+EXPORT_BUFFER_SIZE = 1 << 20
+# Excel header styles, shared by every header cell
+HEADER_FONT = Font(bold=True)
+HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+
+COORDINATES_RE = re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+)')
+REVIEW_COUNT_RE = re.compile(r'\((\d+)\)')
+HREF_RE = re.compile(r'href=["\'](.*?)["\']')
+WEBSITE_PATTERNS = (
+    re.compile(r'https?://[^\s<>"\'{}|\\^`[\]]+'),
+    re.compile(r'www\.[^\s<>"\'{}|\\^`[\]]+')
+)
+
+# Reads every field of the open business panel in a single round-trip,
+# trying the same fallback selectors in order
+BUSINESS_DETAILS_JS = """
+() => {
+    const first = (selectors) => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element) return element;
+        }
+        return null;
+    };
+    const text = (selector) => {
+        const element = document.querySelector(selector);
+        return element ? element.textContent.trim() : null;
+    };
+    
+    let website = null;
+    for (const selector of [
+        "a[data-item-id='authority']",
+        "a[href*='http']",
+        "button[data-item-id*='website']",
+        "a[aria-label*='Website']",
+        "a[aria-label*='website']"
+    ]) {
+        const element = document.querySelector(selector);
+        const href = element && element.getAttribute('href');
+        if (href && href.startsWith('http')) {
+            website = href;
+            break;
+        }
+    }
+    
+    const address = first(["button[data-item-id='address']", ".AYHFM", ".Io6YTe"]);
+    
+    let phone = 'N/A';
+    const phoneElement = first([
+        "button[data-item-id='phone']",
+        "span[data-item-id='phone']",
+        "a[href^='tel:']"
+    ]);
+    if (phoneElement) {
+        phone = phoneElement.textContent.trim();
+        const href = phoneElement.getAttribute('href');
+        if (!phone && href && href.startsWith('tel:')) {
+            phone = href.replace('tel:', '');
+        }
+    }
+    
+    const hours = document.querySelector("button[data-item-id='oh']");
+    
+    return {
+        name: text('h1.DUwDvf'),
+        website: website,
+        address: address ? address.textContent.trim() : 'N/A',
+        phone: phone,
+        rating: text('span.MW4etd'),
+        review_count: text('span.UY7F9'),
+        business_hours: hours ? hours.getAttribute('aria-label') : null,
+        price_range: text('span.mgr77e'),
+        category: text("button[jsaction='pane.rating.category']")
+    };
+}
+"""
+
+# Place URLs of the businesses currently listed in the results sidebar
+PLACE_URLS_JS = """
+() => Array.from(document.querySelectorAll('.Nv2PK a[href*="/maps/place/"]'), (link) => link.href)
+"""
+
+# Resource types the scraper never needs to render a business panel
+BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font", "stylesheet"))
+
+def block_heavy_resources(route):
+    """Playwright route handler that aborts requests for heavy resources"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+def extract_links(content):
+    """Return the href of every link in an HTML document"""
+    if HTMLParser is not None:
+        tree = HTMLParser(content)
+        return [node.attributes.get('href') or '' for node in tree.css('a[href]')]
+    return HREF_RE.findall(content)
+
+# Instances are still updated in place by the crawl workers, so the class
+# is slotted for a smaller footprint but not frozen
+@dataclass(slots=True)
 class BusinessData:
     """Enhanced business data structure"""
     name: str
@@ -62,30 +214,206 @@ class BusinessData:
     scraped_at: str
     distance_km: Optional[float] = None
 
+_BUSINESS_FIELDS = fields(BusinessData)
+
+def as_shallow_dict(business):
+    """Convert BusinessData to a dict without asdict()'s deep copy of every field"""
+    return {f.name: getattr(business, f.name) for f in _BUSINESS_FIELDS}
+
+def encode_social_media(social_media):
+    """Encode a social media mapping for a CSV cell"""
+    # Most businesses have no profiles, skip the encoder for those
+    return dumps_json(social_media) if social_media else '{}'
+
+def encode_coordinates(coordinates):
+    """Encode a lat/lng pair for a CSV cell, or '' when missing"""
+    # Encoded like every other JSON cell so CSV and Excel agree
+    return dumps_json(coordinates) if coordinates else ''
+
+def _identity(value):
+    return value
+
+# CSV schema is fixed by BusinessData, so the header row and the per-column
+# encoders are built once at import time
+CSV_FIELD_ENCODERS = {
+    'emails': ', '.join,
+    'social_media': encode_social_media,
+    'coordinates': encode_coordinates,
+}
+CSV_HEADERS = [f.name for f in _BUSINESS_FIELDS]
+CSV_ENCODERS = [(name, CSV_FIELD_ENCODERS.get(name, _identity)) for name in CSV_HEADERS]
+
+def _excel_text(value):
+    return str(value) if value else ""
+
+def _excel_json(value):
+    return dumps_json(value) if value else ""
+
+# Excel cells are all text; list and dict fields are stored as JSON
+EXCEL_ENCODERS = [
+    _excel_json if name in ('emails', 'social_media', 'coordinates') else _excel_text
+    for name in CSV_HEADERS
+]
+
+# Above this many rows the Excel export skips openpyxl and writes the sheet
+# XML itself, avoiding a Python object and style lookup per cell
+XLSX_DIRECT_THRESHOLD = 50_000
+
+# Characters XML 1.0 does not allow, which openpyxl refuses as well
+XML_ILLEGAL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    # Style 1 is the bold, gray-filled header, matching HEADER_FONT/HEADER_FILL
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="3"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill>'
+        '<fill><patternFill patternType="solid"><fgColor rgb="00CCCCCC"/><bgColor rgb="00CCCCCC"/></patternFill></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ),
+}
+
+def write_xlsx(f, sheet_title, headers, rows):
+    """Write a single-sheet XLSX workbook of text cells straight to a file
+    
+    The sheet XML is streamed into the zip row by row. Empty strings are
+    left as blank cells, the same as openpyxl does.
+    """
+    columns = [get_column_letter(i) for i in range(1, len(headers) + 1)]
+    
+    def row_xml(row_number, values, style=''):
+        cells = [
+            f'<c r="{column}{row_number}" t="inlineStr"{style}><is><t xml:space="preserve">'
+            f'{xml_escape(XML_ILLEGAL_RE.sub("", value))}</t></is></c>'
+            for column, value in zip(columns, values) if value
+        ]
+        return f'<row r="{row_number}">{"".join(cells)}</row>'
+    
+    with zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in XLSX_STATIC_PARTS.items():
+            archive.writestr(name, xml)
+        archive.writestr('xl/workbook.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{xml_escape(sheet_title)}" sheetId="1" r:id="rId1"/></sheets>'
+            '</workbook>'
+        ))
+        
+        with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(row_xml(1, headers, ' s="1"').encode())
+            for row_number, values in enumerate(rows, 2):
+                sheet.write(row_xml(row_number, values).encode())
+            sheet.write(b'</sheetData></worksheet>')
+
 class SessionManager:
-    """Manage scraping sessions with persistence"""
+    """Track the sites crawled during a scraping session"""
     
-    def __init__(self, session_file="session.pkl"):
-        self.session_file = session_file
-        self.session_data = self.load_session()
+    def __init__(self, results_file=None):
+        self._lock = threading.Lock()
+        # Contact data of crawled sites, so a site shared by several
+        # businesses (or logged by an earlier run) is only crawled once
+        self.completed_results = {}
+        
+        # Optional JSONL log of finished businesses, appended to one line at
+        # a time as the scrape progresses and read back on the next run
+        self.results_file = results_file
+        self._results_log = None
+        if results_file:
+            ends_cleanly = self.load_results()
+            self._results_log = open(results_file, 'a', encoding='utf-8')
+            if not ends_cleanly:
+                # Don't glue the first new record onto a cut-off line
+                self._results_log.write('\n')
+    
+    def mark_completed(self, url, emails, social_media):
+        """Record a processed URL and the data found on it"""
+        with self._lock:
+            self.completed_results[url] = (emails, social_media)
     
-    def save_session(self, data):
-        """Save current session data"""
-        self.session_data.update(data)
-        with open(self.session_file, 'wb') as f:
-            pickle.dump(self.session_data, f)
+    def record_result(self, business):
+        """Append a finished business to the results log, if there is one"""
+        if self._results_log is None:
+            return
+        line = dumps_json(as_shallow_dict(business)) + '\n'
+        with self._lock:
+            if self._results_log is not None:
+                self._results_log.write(line)
+                self._results_log.flush()
     
-    def load_session(self):
-        """Load previous session data"""
+    def load_results(self):
+        """Restore the contact data of sites logged by earlier runs
+        
+        Returns False if the log's last line was cut off mid-record.
+        """
+        line = ''
         try:
-            with open(self.session_file, 'rb') as f:
-                return pickle.load(f)
+            with open(self.results_file, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # blank, or cut short by an interrupted run
+                    # Only records that carry data are worth skipping a crawl
+                    # for, sites that came back empty are tried again
+                    if record.get('website') and (record.get('emails') or record.get('social_media')):
+                        self.completed_results[record['website']] = (
+                            record['emails'], record['social_media']
+                        )
         except FileNotFoundError:
-            return {"completed_urls": set(), "failed_urls": set(), "results": []}
+            pass
+        return not line or line.endswith('\n')
     
-    def is_completed(self, url):
-        """Check if URL was already processed"""
-        return url in self.session_data.get("completed_urls", set())
+    def completed_result(self, url):
+        """Return copies of the (emails, social_media) found for a URL, or None"""
+        with self._lock:
+            result = self.completed_results.get(url)
+        if result is None:
+            return None
+        emails, social_media = result
+        return list(emails), dict(social_media)
+    
+    def close(self):
+        """Close the results log"""
+        with self._lock:
+            if self._results_log is not None:
+                self._results_log.close()
+                self._results_log = None
 
 class ProxyRotator:
     """Handle proxy rotation for large-scale scraping"""
@@ -105,19 +433,19 @@ class ProxyRotator:
 class EmailValidator:
     """Validate and score email addresses"""
     
-    INVALID_PATTERNS = [
-        r'.*noreply.*', r'.*no-reply.*', r'.*admin.*', r'.*test.*',
-        r'.*example.*', r'.*dummy.*', r'.*webmaster.*'
-    ]
+    # Plain substring checks, most common hits first
+    INVALID_SUBSTRINGS = (
+        'noreply', 'no-reply', 'example', 'admin', 'webmaster', 'test', 'dummy'
+    )
     
-    EMAIL_CATEGORIES = {
-        'info': r'info@.*',
-        'contact': r'contact@.*',
-        'sales': r'sales@.*',
-        'support': r'support@.*',
-        'hello': r'hello@.*',
-        'general': r'.*@.*'
-    }
+    EMAIL_CATEGORIES = tuple((category, re.compile(pattern, re.IGNORECASE)) for category, pattern in (
+        ('info', r'info@.*'),
+        ('contact', r'contact@.*'),
+        ('sales', r'sales@.*'),
+        ('support', r'support@.*'),
+        ('hello', r'hello@.*'),
+        ('general', r'.*@.*')
+    ))
     
     @classmethod
     def validate_email(cls, email):
@@ -125,18 +453,14 @@ class EmailValidator:
         if not validators.email(email):
             return False
         
-        for pattern in cls.INVALID_PATTERNS:
-            if re.match(pattern, email.lower()):
-                return False
-        
-        return True
+        email_lower = email.lower()
+        return not any(invalid in email_lower for invalid in cls.INVALID_SUBSTRINGS)
     
     @classmethod
     def categorize_email(cls, email):
         """Categorize email by type"""
-        email_lower = email.lower()
-        for category, pattern in cls.EMAIL_CATEGORIES.items():
-            if re.match(pattern, email_lower):
+        for category, pattern in cls.EMAIL_CATEGORIES:
+            if pattern.match(email):
                 return category
         return 'other'
     
@@ -161,90 +485,71 @@ class SocialMediaExtractor:
     """Extract social media profiles from websites"""
     
     SOCIAL_PATTERNS = {
-        'facebook': r'(?:https?://)?(?:www\.)?facebook\.com/[\w\.-]+',
-        'instagram': r'(?:https?://)?(?:www\.)?instagram\.com/[\w\.-]+',
-        'twitter': r'(?:https?://)?(?:www\.)?twitter\.com/[\w\.-]+',
-        'linkedin': r'(?:https?://)?(?:www\.)?linkedin\.com/[\w\.-/]+',
-        'youtube': r'(?:https?://)?(?:www\.)?youtube\.com/[\w\.-/]+',
-        'tiktok': r'(?:https?://)?(?:www\.)?tiktok\.com/@[\w\.-]+'
+        'facebook': r'facebook\.com/[\w\.-]+',
+        'instagram': r'instagram\.com/[\w\.-]+',
+        'twitter': r'twitter\.com/[\w\.-]+',
+        'linkedin': r'linkedin\.com/[\w\.-/]+',
+        'youtube': r'youtube\.com/[\w\.-/]+',
+        'tiktok': r'tiktok\.com/@[\w\.-]+'
     }
     
+    # All platforms in one alternation so the text is scanned once; the
+    # named group that matched tells us the platform
+    SOCIAL_RE = re.compile(
+        r'(?:https?://)?(?:www\.)?(?:'
+        + '|'.join(f'(?P<{platform}>{pattern})' for platform, pattern in SOCIAL_PATTERNS.items())
+        + ')',
+        re.IGNORECASE
+    )
+    
+    # Domains checked with a plain substring test before running the regex
+    SOCIAL_DOMAINS = tuple(f'{platform}.com/' for platform in SOCIAL_PATTERNS)
+    
     @classmethod
     def extract_social_media(cls, text):
         """Extract social media URLs from text"""
         social_links = {}
         
-        for platform, pattern in cls.SOCIAL_PATTERNS.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                # Clean and validate URL
-                url = matches[0]
-                if not url.startswith('http'):
-                    url = 'https://' + url
-                social_links[platform] = url
+        # Most pages link to none of the platforms, skip the regex scan then.
+        # The regex ignores case, so the guard must too
+        lowered = text.lower()
+        if not any(domain in lowered for domain in cls.SOCIAL_DOMAINS):
+            return social_links
+        
+        for match in cls.SOCIAL_RE.finditer(text):
+            # Only the first profile per platform is kept
+            if match.lastgroup in social_links:
+                continue
+            
+            # Clean and validate URL
+            url = match.group(0)
+            if not url.startswith('http'):
+                url = 'https://' + url
+            social_links[match.lastgroup] = url
+            
+            if len(social_links) == len(cls.SOCIAL_PATTERNS):
+                break
         
         return social_links
 
 class BusinessIntelligenceExtractor:
-    """Extract business intelligence data"""
+    """Parse business intelligence data read from the Google Maps panel"""
     
     @staticmethod
-    def extract_rating(page):
-        """Extract business rating from Google Maps"""
+    def parse_rating(rating_text):
+        """Parse the business rating"""
         try:
-            rating_element = page.query_selector("span.MW4etd")
-            if rating_element:
-                return float(rating_element.text_content().strip())
-        except (PlaywrightTimeoutError, ValueError):
+            return float(rating_text) if rating_text else None
+        except ValueError:
             return None
-        return None
     
     @staticmethod
-    def extract_review_count(page):
-        """Extract review count"""
-        try:
-            review_element = page.query_selector("span.UY7F9")
-            if review_element:
-                review_text = review_element.text_content().strip()
-                # Extract number from text like "(123)"
-                match = re.search(r'\((\d+)\)', review_text)
-                return int(match.group(1)) if match else None
-        except (PlaywrightTimeoutError, ValueError):
+    def parse_review_count(review_text):
+        """Parse review count from text like (123)"""
+        if not review_text:
             return None
-        return None
-    
-    @staticmethod
-    def extract_business_hours(page):
-        """Extract business hours"""
-        try:
-            hours_button = page.query_selector("button[data-item-id='oh']")
-            if hours_button:
-                return hours_button.get_attribute("aria-label")
-        except PlaywrightTimeoutError:
-            return None
-        return None
-    
-    @staticmethod
-    def extract_price_range(page):
-        """Extract price range indicators"""
-        try:
-            price_element = page.query_selector("span.mgr77e")
-            if price_element:
-                return price_element.text_content().strip()
-        except PlaywrightTimeoutError:
-            return None
-        return None
-    
-    @staticmethod
-    def extract_category(page):
-        """Extract business category"""
-        try:
-            category_element = page.query_selector("button[jsaction='pane.rating.category']")
-            if category_element:
-                return category_element.text_content().strip()
-        except PlaywrightTimeoutError:
-            return None
-        return None
+        match = REVIEW_COUNT_RE.search(review_text)
+        return int(match.group(1)) if match else None
 
 class EnhancedWebsiteCrawler:
     """Enhanced website crawler with intelligent page detection"""
@@ -253,6 +558,32 @@ class EnhancedWebsiteCrawler:
         self.session_manager = session_manager
         self.proxy_rotator = proxy_rotator
         self.failed_websites = []
+        
+        # Pooled session so pages on the same host reuse TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
+    
+    # Path words that suggest a page carries contact info
+    HIGH_VALUE_TOKENS = frozenset(('contact', 'contacts', 'contactus', 'about', 'aboutus', 'team'))
+    MEDIUM_VALUE_TOKENS = frozenset(('support', 'help', 'reach'))
+    
+    @classmethod
+    def score_page_relevance(cls, page_url):
+        """Score how likely a page is to contain contact info from its URL path"""
+        tokens = set(URL_TOKEN_SPLIT_RE.split(urlparse(page_url).path.lower()))
+        
+        score = 0
+        if not tokens.isdisjoint(cls.HIGH_VALUE_TOKENS):
+            score += 3
+        if not tokens.isdisjoint(cls.MEDIUM_VALUE_TOKENS):
+            score += 2
+        return score
     
     def get_headers(self):
         """Get randomized headers"""
@@ -263,26 +594,33 @@ class EnhancedWebsiteCrawler:
         ]
         return {"User-Agent": random.choice(user_agents)}
     
+    def get_proxies(self):
+        """Get the requests proxies mapping for the next proxy in rotation"""
+        proxy = self.proxy_rotator.get_proxy()
+        if proxy:
+            return {"http": proxy, "https": proxy}
+        return None
+    
     def fetch_with_retry(self, url, retries=3, base_delay=2):
-        """Enhanced fetch with proxy support and better error handling"""
+        """Enhanced fetch with proxy support and better error handling
+        
+        The response is streamed; read its body with read_text().
+        """
         for attempt in range(1, retries + 1):
             try:
-                proxies = None
-                proxy = self.proxy_rotator.get_proxy()
-                if proxy:
-                    proxies = {"http": proxy, "https": proxy}
-                
-                response = requests.get(
+                response = self.session.get(
                     url, 
                     headers=self.get_headers(), 
                     timeout=15, 
-                    proxies=proxies,
-                    verify=False
+                    proxies=self.get_proxies(),
+                    stream=True
                 )
                 
                 if response.status_code == 200:
                     return response
-                elif response.status_code == 429:  # Rate limited
+                
+                response.close()
+                if response.status_code == 429:  # Rate limited
                     time.sleep(base_delay * attempt * 2)
                     continue
                     
@@ -295,173 +633,263 @@ class EnhancedWebsiteCrawler:
         self.failed_websites.append(url)
         return None
     
+    def read_text(self, response, max_bytes=MAX_PAGE_BYTES):
+        """Read at most max_bytes of a streamed response body as text"""
+        try:
+            body = response.raw.read(max_bytes, decode_content=True)
+        finally:
+            response.close()
+        return body.decode(response.encoding or 'utf-8', errors='replace')
+    
+    def is_html_page(self, url):
+        """Probe a URL with HEAD and report whether it's worth a GET"""
+        try:
+            response = self.session.head(
+                url,
+                headers=self.get_headers(),
+                timeout=8,
+                proxies=self.get_proxies(),
+                allow_redirects=True
+            )
+        except Exception:
+            # Let the GET and its retries decide
+            return True
+        
+        if response.status_code in (404, 410):
+            return False
+        content_type = response.headers.get('Content-Type', '')
+        return response.status_code != 200 or not content_type or 'html' in content_type
+    
     def extract_emails_and_social(self, url, max_pages=5):
         """Extract emails and social media from website"""
-        if self.session_manager.is_completed(url):
-            return [], {}
+        # Sites already crawled this run hand back what was found then
+        completed = self.session_manager.completed_result(url)
+        if completed is not None:
+            return completed
         
         visited = set()
         emails = set()
         social_media = {}
         
-        def score_page_relevance(page_url, content):
-            """Score how likely a page is to contain contact info"""
-            score = 0
-            page_lower = page_url.lower()
-            content_lower = content.lower()
-            
-            # URL-based scoring
-            if any(keyword in page_lower for keyword in ['contact', 'about', 'team']):
-                score += 3
-            if any(keyword in page_lower for keyword in ['support', 'help', 'reach']):
-                score += 2
-            
-            # Content-based scoring
-            if 'contact us' in content_lower or 'get in touch' in content_lower:
-                score += 2
-            if '@' in content:
-                score += 1
-                
-            return score
-        
-        def crawl_page(page_url, depth=0):
-            if depth >= max_pages or page_url in visited:
-                return
-            
-            visited.add(page_url)
+        def fetch_and_parse(page_url, score, find_links):
+            """Fetch a page and return its emails, social links and best child links"""
+            # Only likely contact pages are fetched outright, other links are
+            # probed first so documents and dead links aren't downloaded
+            if 0 < score < 3 and not self.is_html_page(page_url):
+                return None
             
             response = self.fetch_with_retry(page_url)
             if not response:
-                return
+                return None
             
-            try:
-                content = response.text
-                
-                # Extract emails with context
-                found_emails = re.findall(
-                    r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", 
-                    content
-                )
-                
-                validated_emails = []
-                for email in found_emails:
-                    if EmailValidator.validate_email(email):
-                        validated_emails.append(email)
-                
-                emails.update(validated_emails)
-                
-                # Extract social media
-                page_social = SocialMediaExtractor.extract_social_media(content)
-                social_media.update(page_social)
-                
-                # Find and prioritize relevant links
-                domain = urlparse(url).netloc
-                links = re.findall(r'href=["\'](.*?)["\']', content)
-                
-                scored_links = []
-                for link in links:
-                    abs_link = urljoin(page_url, link)
-                    if (urlparse(abs_link).netloc == domain and 
-                        abs_link.startswith("http") and 
-                        abs_link not in visited):
-                        score = score_page_relevance(abs_link, "")
-                        scored_links.append((score, abs_link))
-                
-                # Crawl highest-scored links first
-                scored_links.sort(reverse=True)
-                for score, link in scored_links[:3]:  # Limit to top 3 links per page
-                    if score > 0:
-                        crawl_page(link, depth + 1)
+            # Links are only needed while there is page budget left
+            return parse_page(self.read_text(response), page_url, domain, find_links)
+        
+        # Crawl in rounds: each round fetches the best unvisited links
+        # concurrently, up to max_pages pages in total
+        domain = urlparse(url).netloc
+        frontier = [(0, url)]
+        fetched = False
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            while frontier and len(visited) < max_pages:
+                frontier.sort(reverse=True)
+                batch = []
+                while frontier and len(visited) < max_pages:
+                    score, page_url = frontier.pop(0)
+                    if page_url not in visited:
+                        visited.add(page_url)
+                        batch.append((score, page_url))
                 
-            except Exception as e:
-                logging.error(f"Error crawling {page_url}: {e}")
+                find_links = len(visited) < max_pages
+                futures = {
+                    executor.submit(fetch_and_parse, page_url, score, find_links): page_url
+                    for score, page_url in batch
+                }
+                for future in as_completed(futures):
+                    try:
+                        page_result = future.result()
+                    except Exception as e:
+                        logging.error(f"Error crawling {futures[future]}: {e}")
+                        continue
+                    if page_result is None:
+                        continue
+                    
+                    if futures[future] == url:
+                        fetched = True
+                    page_emails, page_social, child_links = page_result
+                    emails.update(page_emails)
+                    social_media.update(page_social)
+                    frontier.extend(
+                        (score, link) for score, link in child_links if link not in visited
+                    )
         
-        crawl_page(url)
-        self.session_manager.save_session({"completed_urls": {url}})
+        # Sites that could not be fetched stay eligible for retry_failed_websites
+        emails = list(emails)
+        if fetched:
+            self.session_manager.mark_completed(url, emails, social_media)
         
-        return list(emails), social_media
+        return emails, social_media
+
+def parse_page(content, page_url, domain, find_links=True):
+    """Extract emails, social media and the best same-site links from a page"""
+    # Extract emails with context, no address without an '@'
+    found_emails = EMAIL_RE.findall(content) if '@' in content else []
+    
+    validated_emails = []
+    for email in found_emails:
+        if EmailValidator.validate_email(email):
+            validated_emails.append(email)
+    
+    # Extract social media
+    page_social = SocialMediaExtractor.extract_social_media(content)
+    
+    if not find_links:
+        return validated_emails, page_social, []
+    
+    # Find and prioritize relevant links. Navigation repeats the same
+    # hrefs many times per page, and "#section" variants point at the
+    # same document, so each distinct page is only scored once
+    links = {urldefrag(urljoin(page_url, link))[0] for link in set(extract_links(content))}
+    
+    scored_links = []
+    for abs_link in links:
+        if (urlparse(abs_link).netloc == domain and 
+            abs_link.startswith("http")):
+            score = EnhancedWebsiteCrawler.score_page_relevance(abs_link)
+            if score > 0:
+                scored_links.append((score, abs_link))
+    
+    scored_links.sort(reverse=True)
+    return validated_emails, page_social, scored_links[:3]  # Limit to top 3 links per page
 
 class DatabaseManager:
     """Manage SQLite database for results storage"""
     
+    # Rows encoded and handed to executemany at a time
+    insert_chunk_size = 10_000
+    
     def __init__(self, db_path="businesses.db"):
         self.db_path = db_path
+        # One connection for the manager's lifetime; writes may come from
+        # worker threads, so access is serialized with a lock
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.lock = threading.Lock()
         self.init_database()
     
     def init_database(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS businesses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                address TEXT,
-                phone TEXT,
-                website TEXT,
-                emails TEXT,
-                social_media TEXT,
-                rating REAL,
-                review_count INTEGER,
-                business_hours TEXT,
-                price_range TEXT,
-                category TEXT,
-                coordinates TEXT,
-                status TEXT,
-                confidence_score REAL,
-                scraped_at TEXT,
-                distance_km REAL
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS businesses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT,
+                    address TEXT,
+                    phone TEXT,
+                    website TEXT,
+                    emails TEXT,
+                    social_media TEXT,
+                    rating REAL,
+                    review_count INTEGER,
+                    business_hours TEXT,
+                    price_range TEXT,
+                    category TEXT,
+                    coordinates TEXT,
+                    status TEXT,
+                    confidence_score REAL,
+                    scraped_at TEXT,
+                    distance_km REAL
+                )
+            """)
+            
+            self.conn.commit()
     
     def save_businesses(self, businesses):
         """Save businesses to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for business in businesses:
-            business_dict = asdict(business)
-            business_dict['emails'] = json.dumps(business_dict['emails'])
-            business_dict['social_media'] = json.dumps(business_dict['social_media'])
-            business_dict['coordinates'] = json.dumps(business_dict['coordinates']) if business_dict['coordinates'] else None
-            
-            cursor.execute("""
-                INSERT INTO businesses (
-                    name, address, phone, website, emails, social_media,
-                    rating, review_count, business_hours, price_range, category,
-                    coordinates, status, confidence_score, scraped_at, distance_km
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, tuple(business_dict.values()))
+        # Rows are generated lazily and encoded one chunk at a time
+        rows = (
+            (
+                business.name, business.address, business.phone, business.website,
+                json.dumps(business.emails), json.dumps(business.social_media),
+                business.rating, business.review_count, business.business_hours,
+                business.price_range, business.category,
+                json.dumps(business.coordinates) if business.coordinates else None,
+                business.status, business.confidence_score, business.scraped_at,
+                business.distance_km
+            )
+            for business in businesses
+        )
         
-        conn.commit()
-        conn.close()
+        # All chunks go in one transaction, committed at the end or rolled
+        # back as a whole if any insert fails
+        with self.lock, self.conn:
+            while True:
+                chunk = list(islice(rows, self.insert_chunk_size))
+                if not chunk:
+                    break
+                self.conn.executemany("""
+                    INSERT INTO businesses (
+                        name, address, phone, website, emails, social_media,
+                        rating, review_count, business_hours, price_range, category,
+                        coordinates, status, confidence_score, scraped_at, distance_km
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, chunk)
+    
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.conn.close()
 
 class EnhancedBusinessScraper:
     """Main scraper class with all enhanced features"""
     
-    def __init__(self, args):
+    def __init__(self, args, playwright_driver=None, browser=None, keep_browser=False):
         self.args = args
-        self.session_manager = SessionManager()
+        # Names every output file of this run after the time it started
+        self.run_id = time.strftime("%Y%m%d_%H%M%S")
+        self.session_manager = SessionManager(results_file=getattr(args, 'session_log', None))
         self.proxy_rotator = ProxyRotator(args.proxies)
         self.website_crawler = EnhancedWebsiteCrawler(self.session_manager, self.proxy_rotator)
         self.db_manager = DatabaseManager() if args.save_db else None
         self.stats = {
             'total_scraped': 0,
             'emails_found': 0,
+            'businesses_with_emails': 0,
             'social_found': 0,
             'websites_processed': 0,
             'start_time': time.time()
         }
-        self.playwright = None
-        self.browser = None
+        self.stats_lock = threading.Lock()  # stats are updated by crawl workers
+        # Highest-confidence businesses so far, kept up to date as each one
+        # is finished so the summary doesn't have to rank every result
+        self.top_businesses = []
+        # A running browser can be handed in and kept alive between scrapes
+        # by long-lived callers, saving the Chromium launch on every run
+        self.playwright_driver = playwright_driver
+        self.browser = browser
+        self.keep_browser = keep_browser
+        self.detail_page_batch = 4  # business pages loaded at the same time
+    
+    def __enter__(self):
+        """Launch the browser once and keep it for every scrape in the block"""
+        self.setup_browser()
+        self.keep_browser = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_browser()
     
     def setup_browser(self):
         """Setup Playwright browser with enhanced options"""
-        self.playwright = sync_playwright().start()
+        if self.browser and self.browser.is_connected():
+            return self.browser
+        
+        if not self.playwright_driver:
+            self.playwright_driver = sync_playwright().start()
         
         browser_args = [
             "--disable-gpu",
@@ -486,7 +914,7 @@ class EnhancedBusinessScraper:
                     }
                 }
         
-        self.browser = self.playwright.chromium.launch(
+        self.browser = self.playwright_driver.chromium.launch(
             headless=self.args.headless,
             args=browser_args,
             **proxy_args
@@ -494,12 +922,34 @@ class EnhancedBusinessScraper:
         
         return self.browser
     
+    def new_context(self):
+        """Open a fresh browser context on the (possibly reused) browser"""
+        context = self.setup_browser().new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        )
+        # Only the DOM text is scraped, don't download images, map tiles or fonts
+        context.route("**/*", block_heavy_resources)
+        return context
+    
+    def close_browser(self):
+        """Close the browser and the Playwright driver"""
+        try:
+            if self.browser:
+                self.browser.close()
+            if self.playwright_driver:
+                self.playwright_driver.stop()
+        except Exception:
+            pass
+        self.browser = None
+        self.playwright_driver = None
+    
     def extract_coordinates(self, page):
         """Extract GPS coordinates from Google Maps"""
         try:
             current_url = page.url
             # Extract coordinates from URL
-            match = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', current_url)
+            match = COORDINATES_RE.search(current_url)
             if match:
                 return {'lat': float(match.group(1)), 'lng': float(match.group(2))}
         except Exception:
@@ -511,8 +961,6 @@ class EnhancedBusinessScraper:
         if not coords1 or not coords2:
             return None
         
-        from math import radians, sin, cos, sqrt, atan2
-        
         R = 6371  # Earth's radius in km
         
         lat1, lon1 = radians(coords1['lat']), radians(coords1['lng'])
@@ -526,37 +974,88 @@ class EnhancedBusinessScraper:
         
         return R * c
     
-
-    def extract_website(self, page):
-        """Extract website URL with multiple selectors"""
-        selectors = [
-            "a[data-item-id='authority']",
-            "a[href*='http']",
-            "button[data-item-id*='website']",
-            "a[aria-label*='Website']",
-            "a[aria-label*='website']"
-        ]
+    def finish_business(self, business):
+        """Log a business whose data is final and rank it for the summary"""
+        self.session_manager.record_result(business)
+        with self.stats_lock:
+            # Scores only ever go up once a business is finished, so a
+            # retried business either stays in the top 5 or may enter it
+            candidates = [top for top in self.top_businesses if top is not business]
+            candidates.append(business)
+            self.top_businesses = heapq.nlargest(5, candidates, key=attrgetter('confidence_score'))
+    
+    def crawl_business_website(self, business):
+        """Fill in a business's emails and social media from its website"""
+        try:
+            emails, social_media = self.website_crawler.extract_emails_and_social(
+                business.website, max_pages=self.args.max_pages
+            )
+        except Exception as e:
+            logging.error(f"Error processing website {business.website}: {e}")
+            business.status = "Website error"
+            business.confidence_score = 0.1
+            self.finish_business(business)
+            return
         
-        for selector in selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    href = element.get_attribute("href")
-                    if href and href.startswith('http'):
-                        return href
-            except Exception:
-                continue
+        business.emails = emails
+        business.social_media = social_media
+        if emails or social_media:
+            business.status = "Data extracted"
+            business.confidence_score = 0.8
+        else:
+            business.status = "No contact info found"
+            business.confidence_score = 0.4
+        self.finish_business(business)
+        
+        with self.stats_lock:
+            self.stats['websites_processed'] += 1
+            if emails:
+                self.stats['emails_found'] += len(emails)
+                self.stats['businesses_with_emails'] += 1
+            if social_media:
+                self.stats['social_found'] += len(social_media)
+    
+    def open_detail_pages(self, context, urls):
+        """Load place pages in overlapping batches and yield each once it's ready
         
-        # Try to extract from the page content as a fallback
+        Navigations in a batch are started together, so the pages load in
+        parallel while the earlier ones are being extracted.
+        """
+        for start in range(0, len(urls), self.detail_page_batch):
+            pages = []
+            for url in urls[start:start + self.detail_page_batch]:
+                detail_page = context.new_page()
+                pages.append(detail_page)
+                try:
+                    detail_page.goto(url, wait_until="commit")
+                except Exception as e:
+                    logging.error(f"Error opening {url}: {e}")
+            
+            try:
+                for detail_page in pages:
+                    try:
+                        detail_page.wait_for_selector("h1.DUwDvf", timeout=15000)
+                    except Exception:
+                        logging.warning(f"Timeout waiting for business details: {detail_page.url}")
+                        continue
+                    yield detail_page
+            finally:
+                for detail_page in pages:
+                    try:
+                        detail_page.close()
+                    except Exception:
+                        pass
+    
+    def extract_business_details(self, page):
+        """Extract all panel fields of the open business with one page.evaluate"""
+        return page.evaluate(BUSINESS_DETAILS_JS)
+    
+    def extract_website_from_content(self, page):
+        """Fall back to the first non-Google URL in the page content"""
         try:
             page_content = page.content()
-            website_patterns = [
-                r'https?://[^\s<>"\'{}|\\^`[\]]+',
-                r'www\.[^\s<>"\'{}|\\^`[\]]+'
-            ]
-            
-            for pattern in website_patterns:
-                matches = re.findall(pattern, page_content)
+            for pattern in WEBSITE_PATTERNS:
+                matches = pattern.findall(page_content)
                 for match in matches:
                     if 'google.com' not in match and 'maps.google.com' not in match:
                         if not match.startswith('http'):
@@ -574,213 +1073,162 @@ class EnhancedBusinessScraper:
         if self.args.location:
             search_url += f"+in+{urllib.parse.quote(self.args.location)}"
         
-        browser = self.setup_browser()
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        )
-        page = context.new_page()
-        
-        page.goto(search_url)
-        
-        # Wait for results to load with a longer timeout
+        context = self.new_context()
         try:
-            page.wait_for_selector(".Nv2PK", timeout=15000)
-        except PlaywrightTimeoutError:
-            logging.warning("Timeout waiting for results to load. Continuing anyway.")
-        
-        results = []
-        processed_names = set()  # Prevent duplicates
-        
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TextColumn("• {task.fields[stats]}"),
-            console=console
-        ) as progress:
+            page = context.new_page()
             
-            scrape_task = progress.add_task(
-                "Scraping businesses", 
-                total=self.args.max_results,
-                stats="Starting..."
-            )
+            page.goto(search_url)
+            
+            # Wait for results to load with a longer timeout
+            try:
+                page.wait_for_selector(".Nv2PK", timeout=15000)
+            except PlaywrightTimeoutError:
+                logging.warning("Timeout waiting for results to load. Continuing anyway.")
             
-            scroll_attempts = 0
-            max_scroll_attempts = 10
+            results = []
+            processed_names = set()  # Prevent duplicates
+            seen_urls = set()
             
-            while len(results) < self.args.max_results and scroll_attempts < max_scroll_attempts:
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TextColumn("• {task.fields[stats]}"),
+                console=console
+            ) as progress:
+                
+                scrape_task = progress.add_task(
+                    "Scraping businesses", 
+                    total=self.args.max_results,
+                    stats="Starting..."
+                )
+                
+                scroll_attempts = 0
+                max_scroll_attempts = 10
+                
+                crawl_executor = ThreadPoolExecutor(max_workers=4)
+                crawl_futures = []
+                
                 try:
-                    businesses = page.query_selector_all(".Nv2PK")
-                    
-                    for i, biz in enumerate(businesses):
-                        if len(results) >= self.args.max_results:
-                            break
-                        
+                    while len(results) < self.args.max_results and scroll_attempts < max_scroll_attempts:
                         try:
-                            # Click on the business using Playwright
-                            biz.click()
-                            page.wait_for_timeout(random.randint(2000, 4000))  # Random delay
-                            
-                            # Extract basic info
-                            name_element = page.query_selector("h1.DUwDvf")
-                            name = name_element.text_content().strip() if name_element else "N/A"
-                            
-                            # Skip if already processed (duplicate)
-                            if name in processed_names or name == "N/A":
-                                continue
-                            processed_names.add(name)
-                            
-                            # Extract all available data
-                            website = self.extract_website(page)
-                            address = self.extract_address(page)
-                            phone = self.extract_phone(page)
+                            # Collect the place URLs of listed businesses not seen yet
+                            place_urls = [
+                                url for url in page.evaluate(PLACE_URLS_JS) if url not in seen_urls
+                            ]
+                            seen_urls.update(place_urls)
                             
-                            # Business intelligence data
-                            rating = BusinessIntelligenceExtractor.extract_rating(page)
-                            review_count = BusinessIntelligenceExtractor.extract_review_count(page)
-                            business_hours = BusinessIntelligenceExtractor.extract_business_hours(page)
-                            price_range = BusinessIntelligenceExtractor.extract_price_range(page)
-                            category = BusinessIntelligenceExtractor.extract_category(page)
-                            coordinates = self.extract_coordinates(page)
-                            
-                            # Process website for emails and social media
-                            emails = []
-                            social_media = {}
-                            status = "No website"
-                            confidence_score = 0.0
-                            
-                            if website:
-                                status = "Processing website"
-                                progress.update(scrape_task, stats=f"Processing {name[:20]}...")
+                            for detail_page in self.open_detail_pages(context, place_urls):
+                                if len(results) >= self.args.max_results:
+                                    break
                                 
                                 try:
-                                    emails, social_media = self.website_crawler.extract_emails_and_social(
-                                        website, max_pages=self.args.max_pages
+                                    # Extract all panel data in one round-trip
+                                    details = self.extract_business_details(detail_page)
+                                    name = details['name'] or "N/A"
+                                    
+                                    # Skip if already processed (duplicate)
+                                    if name in processed_names or name == "N/A":
+                                        continue
+                                    processed_names.add(name)
+                                    
+                                    website = details['website'] or self.extract_website_from_content(detail_page)
+                                    address = details['address']
+                                    phone = details['phone']
+                                    
+                                    # Business intelligence data
+                                    rating = BusinessIntelligenceExtractor.parse_rating(details['rating'])
+                                    review_count = BusinessIntelligenceExtractor.parse_review_count(details['review_count'])
+                                    business_hours = details['business_hours']
+                                    price_range = details['price_range']
+                                    category = details['category']
+                                    coordinates = self.extract_coordinates(detail_page)
+                                    
+                                    # Calculate distance if reference coordinates provided
+                                    distance_km = None
+                                    if hasattr(self.args, 'reference_coords') and coordinates:
+                                        distance_km = self.calculate_distance(self.args.reference_coords, coordinates)
+                                    
+                                    business = BusinessData(
+                                        name=name,
+                                        address=address,
+                                        phone=phone,
+                                        website=website,
+                                        emails=[],
+                                        social_media={},
+                                        rating=rating,
+                                        review_count=review_count,
+                                        business_hours=business_hours,
+                                        price_range=price_range,
+                                        category=category,
+                                        coordinates=coordinates,
+                                        status="Processing website" if website else "No website",
+                                        confidence_score=0.0,
+                                        scraped_at=datetime.now().isoformat(),
+                                        distance_km=distance_km
                                     )
                                     
-                                    if emails or social_media:
-                                        status = "Data extracted"
-                                        confidence_score = 0.8
+                                    # Emails and social media are filled in by the crawl
+                                    # workers while we move on to the next business
+                                    if website:
+                                        crawl_futures.append(
+                                            crawl_executor.submit(self.crawl_business_website, business)
+                                        )
                                     else:
-                                        status = "No contact info found"
-                                        confidence_score = 0.4
-                                        
-                                    self.stats['websites_processed'] += 1
-                                    if emails:
-                                        self.stats['emails_found'] += len(emails)
-                                    if social_media:
-                                        self.stats['social_found'] += len(social_media)
+                                        self.finish_business(business)
+                                    
+                                    results.append(business)
+                                    self.stats['total_scraped'] += 1
                                     
+                                    # Update progress
+                                    progress.update(
+                                        scrape_task, 
+                                        advance=1,
+                                        stats=f"Found: {self.stats['businesses_with_emails']} with emails"
+                                    )
+                                
                                 except Exception as e:
-                                    logging.error(f"Error processing website {website}: {e}")
-                                    status = "Website error"
-                                    confidence_score = 0.1
-                            
-                            # Calculate distance if reference coordinates provided
-                            distance_km = None
-                            if hasattr(self.args, 'reference_coords') and coordinates:
-                                distance_km = self.calculate_distance(self.args.reference_coords, coordinates)
-                            
-                            business = BusinessData(
-                                name=name,
-                                address=address,
-                                phone=phone,
-                                website=website,
-                                emails=emails,
-                                social_media=social_media,
-                                rating=rating,
-                                review_count=review_count,
-                                business_hours=business_hours,
-                                price_range=price_range,
-                                category=category,
-                                coordinates=coordinates,
-                                status=status,
-                                confidence_score=confidence_score,
-                                scraped_at=datetime.now().isoformat(),
-                                distance_km=distance_km
-                            )
-                            
-                            results.append(business)
-                            self.stats['total_scraped'] += 1
-                            
-                            # Update progress
-                            progress.update(
-                                scrape_task, 
-                                advance=1,
-                                stats=f"Found: {len([r for r in results if r.emails])} with emails"
-                            )
+                                    logging.error(f"Error scraping business: {e}")
+                                    continue
                             
+                            # Scroll to load more results
+                            page.evaluate("""
+                                const scrollContainer = document.querySelector('div.section-scrollbox') || 
+                                                    document.querySelector('div.m6QErb') ||
+                                                    document.body;
+                                scrollContainer.scrollBy(0, 1000);
+                            """)
+                            page.wait_for_timeout(random.randint(2000, 4000))
+                            scroll_attempts += 1
+                        
                         except Exception as e:
-                            logging.error(f"Error scraping business: {e}")
-                            continue
-                    
-                    # Scroll to load more results
-                    page.evaluate("""
-                        const scrollContainer = document.querySelector('div.section-scrollbox') || 
-                                            document.querySelector('div.m6QErb') ||
-                                            document.body;
-                        scrollContainer.scrollBy(0, 1000);
-                    """)
-                    page.wait_for_timeout(random.randint(2000, 4000))
-                    scroll_attempts += 1
+                            logging.error(f"Error in main scraping loop: {e}")
+                            break
                     
-                except Exception as e:
-                    logging.error(f"Error in main scraping loop: {e}")
-                    break
-        
-        # Clean up Playwright resources
-        try:
-            page.close()
-            context.close()
-            browser.close()
-            self.playwright.stop()
-        except Exception:
-            pass
+                    # Wait for the remaining website crawls, one failed crawl
+                    # doesn't cost the other results
+                    progress.update(scrape_task, stats="Finishing website crawls...")
+                    for future in as_completed(crawl_futures):
+                        try:
+                            future.result()
+                        except Exception as e:
+                            logging.error(f"Error crawling business website: {e}")
+                finally:
+                    # Crawls not started yet are dropped if scraping was aborted
+                    crawl_executor.shutdown(cancel_futures=True)
+        finally:
+            # Clean up Playwright resources, keeping the browser if it's reused
+            try:
+                context.close()
+            except Exception:
+                pass
+            if not self.keep_browser:
+                self.close_browser()
         
         return results
-    
 
 
-    def extract_address(self, page):
-        """Extract address with fallback selectors"""
-        selectors = [
-            "button[data-item-id='address']",
-            ".AYHFM",
-            ".Io6YTe"
-        ]
-        
-        for selector in selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    return element.text_content().strip()
-            except Exception:
-                continue
-        return "N/A"
-    
-    def extract_phone(self, page):
-        """Extract phone with fallback selectors"""
-        selectors = [
-            "button[data-item-id='phone']",
-            "span[data-item-id='phone']",
-            "a[href^='tel:']"
-        ]
-        
-        for selector in selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    text = element.text_content().strip()
-                    if not text:
-                        href = element.get_attribute("href")
-                        if href and href.startswith('tel:'):
-                            return href.replace("tel:", "")
-                    return text
-            except Exception:
-                continue
-        return "N/A"
-    
+
     def retry_failed_websites(self, results):
         """Enhanced retry mechanism"""
         if not self.website_crawler.failed_websites:
@@ -811,6 +1259,7 @@ class EnhancedBusinessScraper:
                                 result.social_media.update(social_media)
                                 result.status = "Retry successful"
                                 result.confidence_score = min(result.confidence_score + 0.3, 1.0)
+                                self.finish_business(result)
                                 break
                 except Exception as e:
                     logging.error(f"Retry failed for {site}: {e}")
@@ -819,70 +1268,114 @@ class EnhancedBusinessScraper:
     
     def export_results(self, results):
         """Export results in multiple formats"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # CSV Export
-        if self.args.output_csv:
-            csv_filename = f"businesses_{timestamp}.csv"
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                if results:
-                    writer = csv.DictWriter(f, fieldnames=list(asdict(results[0]).keys()))
-                    writer.writeheader()
-                    for result in results:
-                        row = asdict(result)
-                        row['emails'] = ', '.join(row['emails'])
-                        row['social_media'] = json.dumps(row['social_media'])
-                        row['coordinates'] = json.dumps(row['coordinates']) if row['coordinates'] else ''
-                        writer.writerow(row)
-            console.print(f"✅ CSV saved to: {csv_filename}", style="green")
+        # Output files are opened up front through one ExitStack, each with a
+        # 1 MiB buffer, so an unwritable path fails before any work is done
+        # and every handle is closed however the export ends
+        with ExitStack() as stack:
+            def open_output(extension, mode, **kwargs):
+                return stack.enter_context(
+                    open(f"businesses_{self.run_id}.{extension}", mode, buffering=EXPORT_BUFFER_SIZE, **kwargs)
+                )
+            
+            jobs = []
+            if self.args.output_csv:
+                jobs.append((self.export_csv, open_output('csv', 'w', newline='', encoding='utf-8')))
+            if self.args.output_json:
+                jobs.append((self.export_json, open_output('json', 'w', encoding='utf-8')))
+            if self.args.output_excel:
+                jobs.append((self.export_excel, open_output('xlsx', 'wb')))
             
-        # JSON Export
-        if self.args.output_json:
-            json_filename = f"businesses_{timestamp}.json"
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump([asdict(result) for result in results], f, indent=2, ensure_ascii=False)
-            console.print(f"✅ JSON saved to: {json_filename}", style="green")
-        
-        # Excel Export
-        if self.args.output_excel:
-            excel_filename = f"businesses_{timestamp}.xlsx"
-            workbook = openpyxl.Workbook()
-            sheet = workbook.active
-            sheet.title = "Business Data"
+            # The outputs are independent, so they are written concurrently
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix="export") as executor:
+                futures = [executor.submit(export, f, results) for export, f in jobs]
+                if self.db_manager:
+                    futures.append(executor.submit(self.export_database, results))
+                
+                for future in futures:
+                    future.result()
+    
+    def export_csv(self, f, results):
+        """Write results to an open CSV file"""
+        if results:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADERS)
+            # Columns are read positionally in field order, no per-row dicts
+            get_values = attrgetter(*CSV_HEADERS)
+            encoders = [encode for _, encode in CSV_ENCODERS]
+            writer.writerows(
+                [encode(value) for encode, value in zip(encoders, get_values(result))]
+                for result in results
+            )
+        f.flush()
+        console.print(f"✅ CSV saved to: {f.name}", style="green")
+    
+    def export_json(self, f, results):
+        """Write results to an open JSON file"""
+        # Records are encoded and written one at a time rather than as one
+        # document built in memory
+        f.write('[')
+        for i, result in enumerate(results):
+            f.write(',\n' if i else '\n')
+            f.write(dumps_json(as_shallow_dict(result), indent=True))
+        f.write('\n]')
+        f.flush()
+        console.print(f"✅ JSON saved to: {f.name}", style="green")
+    
+    def export_excel(self, f, results):
+        """Write results to an open Excel workbook file"""
+        # Each column's encoder is picked once from the schema rather than
+        # by type-checking every value
+        get_values = attrgetter(*CSV_HEADERS)
+        rows = (
+            [encode(value) for encode, value in zip(EXCEL_ENCODERS, get_values(result))]
+            for result in results
+        )
+        
+        if len(results) > XLSX_DIRECT_THRESHOLD:
+            write_xlsx(f, "Business Data", CSV_HEADERS, rows)
+        else:
+            # Write-only mode streams rows to disk instead of keeping a Cell
+            # object for every value
+            workbook = openpyxl.Workbook(write_only=True)
+            sheet = workbook.create_sheet("Business Data")
             
             if results:
                 # Headers
-                headers = list(asdict(results[0]).keys())
-                for col, header in enumerate(headers, 1):
-                    cell = sheet.cell(row=1, column=col, value=header)
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+                header_cells = []
+                for header in CSV_HEADERS:
+                    cell = WriteOnlyCell(sheet, value=header)
+                    cell.font = HEADER_FONT
+                    cell.fill = HEADER_FILL
+                    header_cells.append(cell)
+                sheet.append(header_cells)
                 
                 # Data
-                for row, result in enumerate(results, 2):
-                    result_dict = asdict(result)
-                    for col, value in enumerate(result_dict.values(), 1):
-                        if isinstance(value, (list, dict)):
-                            value = json.dumps(value) if value else ""
-                        sheet.cell(row=row, column=col, value=str(value) if value else "")
+                for row in rows:
+                    sheet.append(row)
             
-            workbook.save(excel_filename)
-            console.print(f"✅ Excel saved to: {excel_filename}", style="green")
+            workbook.save(f)
         
-        # Database Export
-        if self.db_manager:
-            self.db_manager.save_businesses(results)
-            console.print("✅ Data saved to database", style="green")
+        f.flush()
+        console.print(f"✅ Excel saved to: {f.name}", style="green")
+    
+    def export_database(self, results):
+        """Save results to the SQLite database"""
+        self.db_manager.save_businesses(results)
+        console.print("✅ Data saved to database", style="green")
     
     def display_summary(self, results):
         """Display enhanced results summary"""
         runtime = time.time() - self.stats['start_time']
         
-        # Calculate additional statistics
-        businesses_with_emails = len([r for r in results if r.emails])
-        businesses_with_social = len([r for r in results if r.social_media])
-        total_emails = sum(len(r.emails) for r in results)
-        avg_confidence = sum(r.confidence_score for r in results) / len(results) if results else 0
+        # Calculate additional statistics in a single pass
+        businesses_with_emails = businesses_with_social = total_emails = 0
+        for r in results:
+            if r.emails:
+                businesses_with_emails += 1
+                total_emails += len(r.emails)
+            businesses_with_social += bool(r.social_media)
+        # fsum consumes the scores at C speed without accumulating rounding error
+        avg_confidence = fsum(map(attrgetter('confidence_score'), results)) / len(results) if results else 0
         
         # Create summary table
         table = Table(title="📊 Scraping Summary")
@@ -890,8 +1383,10 @@ class EnhancedBusinessScraper:
         table.add_column("Value", style="magenta")
         
         table.add_row("Total Businesses Scraped", str(len(results)))
-        table.add_row("Businesses with Emails", f"{businesses_with_emails} ({businesses_with_emails/len(results)*100:.1f}%)")
-        table.add_row("Businesses with Social Media", f"{businesses_with_social} ({businesses_with_social/len(results)*100:.1f}%)")
+        # Percentages of the total, guarded against an empty scrape
+        share = 100 / len(results) if results else 0
+        table.add_row("Businesses with Emails", f"{businesses_with_emails} ({businesses_with_emails * share:.1f}%)")
+        table.add_row("Businesses with Social Media", f"{businesses_with_social} ({businesses_with_social * share:.1f}%)")
         table.add_row("Total Emails Found", str(total_emails))
         table.add_row("Total Social Media Profiles", str(self.stats['social_found']))
         table.add_row("Average Confidence Score", f"{avg_confidence:.2f}")
@@ -903,14 +1398,16 @@ class EnhancedBusinessScraper:
         # Display top businesses by confidence
         if results:
             console.print("\n🏆 Top 5 Businesses by Confidence:", style="bold green")
-            top_businesses = sorted(results, key=lambda x: x.confidence_score, reverse=True)[:5]
             
-            for i, biz in enumerate(top_businesses, 1):
-                console.print(f"{i}. {biz.name} (Score: {biz.confidence_score:.2f})")
+            # Rendered with a single print rather than one per line
+            lines = []
+            for i, biz in enumerate(self.top_businesses, 1):
+                lines.append(f"{i}. {biz.name} (Score: {biz.confidence_score:.2f})")
                 if biz.emails:
-                    console.print(f"   📧 Emails: {', '.join(biz.emails[:3])}{'...' if len(biz.emails) > 3 else ''}")
+                    lines.append(f"   📧 Emails: {', '.join(biz.emails[:3])}{'...' if len(biz.emails) > 3 else ''}")
                 if biz.website:
-                    console.print(f"   🌐 Website: {biz.website}")
+                    lines.append(f"   🌐 Website: {biz.website}")
+            console.print("\n".join(lines))
 
 def main():
     """Main function with enhanced argument parsing"""
@@ -927,6 +1424,8 @@ def main():
     parser.add_argument("--save-db", action="store_true", help="Save results to SQLite database")
     parser.add_argument("--reference-lat", type=float, help="Reference latitude for distance calculation")
     parser.add_argument("--reference-lng", type=float, help="Reference longitude for distance calculation")
+    parser.add_argument("--session-log", metavar="PATH",
+                        help="Append finished businesses to this JSONL file and reuse the contact data it holds on later runs")
     
     args = parser.parse_args()
     
@@ -938,39 +1437,37 @@ def main():
     if not any([args.output_csv, args.output_json, args.output_excel, args.save_db]):
         args.output_csv = True
     
-    # Initialize and run scraper
-    scraper = EnhancedBusinessScraper(args)
-    
-    console.print("🚀 Starting enhanced business scraping...", style="bold blue")
-    console.print(f"🔍 Searching for: {args.query}", style="bold")
-    if args.location:
-        console.print(f"📍 Location: {args.location}", style="bold")
-    
-    try:
-        results = scraper.scrape_google_maps()
-        
-        # Retry failed websites
-        if scraper.website_crawler.failed_websites:
-            results = scraper.retry_failed_websites(results)
-        
-        # Export results
-        scraper.export_results(results)
-        
-        # Display summary
-        scraper.display_summary(results)
-        
-    except KeyboardInterrupt:
-        console.print("\n⏹️  Scraping interrupted by user", style="red")
-    except Exception as e:
-        console.print(f"\n❌ Error during scraping: {e}", style="red")
-        logging.exception("Scraping failed with error:")
-    finally:
-        # Save session data
-        if 'results' in locals():
-            scraper.session_manager.save_session({
-                "completed_urls": set(url for result in results if result.website),
-                "results": [asdict(result) for result in results]
-            })
+    # Initialize and run scraper. The block launches the browser once and
+    # closes it on the way out
+    with EnhancedBusinessScraper(args) as scraper:
+        console.print("🚀 Starting enhanced business scraping...", style="bold blue")
+        console.print(f"🔍 Searching for: {args.query}", style="bold")
+        if args.location:
+            console.print(f"📍 Location: {args.location}", style="bold")
+        
+        try:
+            results = scraper.scrape_google_maps()
+            
+            # Retry failed websites
+            if scraper.website_crawler.failed_websites:
+                results = scraper.retry_failed_websites(results)
+            
+            # Export results
+            scraper.export_results(results)
+            
+            # Display summary
+            scraper.display_summary(results)
+            
+        except KeyboardInterrupt:
+            console.print("\n⏹️  Scraping interrupted by user", style="red")
+        except Exception as e:
+            console.print(f"\n❌ Error during scraping: {e}", style="red")
+            logging.exception("Scraping failed with error:")
+        finally:
+            scraper.website_crawler.close()
+            scraper.session_manager.close()
+            if scraper.db_manager:
+                scraper.db_manager.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file